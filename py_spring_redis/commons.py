@@ -1,3 +1,5 @@
+from functools import cache
+
 from pydantic import BaseModel, Field
 
 
@@ -5,8 +7,19 @@ class RedisKeyDocument(BaseModel):
     id: str = Field(exclude=True)
 
     def get_document_id(self) -> str:
-        return f"{self.__class__.__name__}:{self.id}"
+        return self._get_key_prefix() + self.id
+
+    def dump_json_bytes(self) -> bytes:
+        # Serializes straight to bytes in pydantic-core, skipping the
+        # intermediate dict and str that model_dump + json dumps would build
+        return self.__pydantic_serializer__.to_json(self)
 
     @classmethod
+    @cache
     def get_document_key_base_name(cls) -> str:
         return cls.__name__
+
+    @classmethod
+    @cache
+    def _get_key_prefix(cls) -> str:
+        return cls.__name__ + ":"
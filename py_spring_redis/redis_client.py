@@ -1,13 +1,17 @@
 import functools
-import json
-import time
-from threading import Lock, Thread
-from typing import Any, Callable, Optional, Type, TypeVar, cast
+import queue
+from threading import Event, Thread
+from typing import Any, Callable, Iterator, Optional, Type, TypeVar, Union
 
+import orjson
 from loguru import logger
 from py_spring import Component, Properties, BeanCollection
 from pydantic import Field
-from redis import Redis, RedisError, ConnectionError
+from redis import ConnectionPool, Redis, RedisError, ConnectionError
+from redis.backoff import ExponentialBackoff
+from redis.client import Pipeline
+from redis.commands.core import Script
+from redis.retry import Retry
 
 from py_spring_redis.commons import RedisKeyDocument
 
@@ -21,6 +25,7 @@ class RedisProperties(Properties):
     password: Optional[str] = Field(default=None)
     db: int
     heartbeat_interval: int = Field(default=10)
+    max_connections: int = Field(default=32)
 
 
 def redis_error_handler(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -35,36 +40,64 @@ def redis_error_handler(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
-def thread_safe(func: Callable[..., Any]) -> Callable[..., Any]:
-    @functools.wraps(func)
-    def wrapper(self: "RedisClient", *args, **kwargs) -> Any:
-        with self._lock:
-            return func(self, *args, **kwargs)
-
-    return wrapper
-
-
 class RedisBeanCollection(BeanCollection):
     redis_properties: RedisProperties
 
     @classmethod
     def create_redis(cls) -> Redis:
-        return Redis(
+        # health_check_interval piggybacks a PING only on idle connections and
+        # the retry policy reconnects automatically, so no polling thread is needed.
+        pool = ConnectionPool(
             host=cls.redis_properties.host,
             port=cls.redis_properties.port,
             db=cls.redis_properties.db,
             password=cls.redis_properties.password,
+            max_connections=cls.redis_properties.max_connections,
             socket_timeout=5,
+            socket_keepalive=True,
+            health_check_interval=cls.redis_properties.heartbeat_interval,
+            retry_on_timeout=True,
+            retry=Retry(ExponentialBackoff(), 3),
         )
+        return Redis(connection_pool=pool)
+
+
+WriteOperation = tuple[str, str, Optional[Union[str, bytes]]]
+
+# Compare-and-swap on a JSON document's 'version' field, evaluated server-side
+# so the read-modify-write is one round trip and atomic. Returns 1 on success,
+# 0 when the key is missing and -1 on a version mismatch.
+_SET_IF_VERSION_LUA = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+local obj = cjson.decode(current)
+if obj.version ~= tonumber(ARGV[1]) then
+    return -1
+end
+for field, value in pairs(cjson.decode(ARGV[2])) do
+    obj[field] = value
+end
+obj.version = tonumber(ARGV[1]) + 1
+redis.call('SET', KEYS[1], cjson.encode(obj))
+return 1
+"""
 
 
 class RedisClient(Component):
     redis_properties: RedisProperties
     _redis: Redis
-    _lock: Lock
+    _write_queue: "queue.Queue[WriteOperation]"
+    _stop_event: Event
+    _set_if_version_script: Optional[Script] = None
 
-    def __init__(self):
-        self._lock = Lock()
+    def __init__(self) -> None:
+        # Assigned here (not in post_construct) so the DI container sees a
+        # default for these non-injectable annotations before the lifecycle hooks run
+        self._write_queue = queue.Queue(maxsize=10_000)
+        self._stop_event = Event()
+        self._flusher_thread: Optional[Thread] = None
 
     def _init_redis(self) -> Redis:
         redis = RedisBeanCollection.create_redis()
@@ -75,79 +108,233 @@ class RedisClient(Component):
 
     def post_construct(self) -> None:
         self._redis = self._init_redis()
-        self.start_redis_heart_beat_thread()
+        self.start_write_flusher_thread()
+
+    def pre_destroy(self) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+        # Wait for the worker to drain anything already accepted so a clean
+        # shutdown never drops enqueued writes
+        if self._flusher_thread is not None and self._flusher_thread.is_alive():
+            self._flusher_thread.join()
 
-    @thread_safe
     @redis_error_handler
     def delete(self, key: str) -> None:
         self._redis.delete(key)
-        logger.info(f"[DELETE] Key '{key}' deleted from Redis")
+        logger.trace("[DELETE] Key '{}' deleted from Redis", key)
 
-    @thread_safe
     @redis_error_handler
-    def set(self, key: str, value: str) -> str:
+    def set(self, key: str, value: Union[str, bytes]) -> Union[str, bytes]:
         self._redis.set(key, value)
-        logger.info(f"[SET] Key '{key}' set to value '{value}'")
+        logger.trace("[SET] Key '{}' set to value '{}'", key, value)
         return value
 
-    @thread_safe
     @redis_error_handler
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[bytes]:
         value = self._redis.get(key)
         if value is None:
-            logger.warning(f"[GET] Key '{key}' not found")
+            logger.warning("[GET] Key '{}' not found", key)
+            return
+        logger.trace("[GET] Retrieved value for key '{}': {}", key, value)
+        return value
+
+    def get_text(self, key: str) -> Optional[str]:
+        value = self.get(key)
+        if value is None:
             return
-        result = cast(bytes, value).decode("utf-8")
-        logger.info(f"[GET] Retrieved value for key '{key}': {result}")
-        return result
+        return value.decode("utf-8")
+
+    @redis_error_handler
+    def mset_many(
+        self, pairs: list[tuple[str, Union[str, bytes]]]
+    ) -> Optional[list[tuple[str, Union[str, bytes]]]]:
+        pipe = self._redis.pipeline(transaction=False)
+        for key, value in pairs:
+            pipe.set(key, value)
+        pipe.execute()
+        logger.info("[MSET MANY] Set {} keys in a single pipeline", len(pairs))
+        return pairs
+
+    @redis_error_handler
+    def mget_many(self, keys: list[str]) -> Optional[list[Optional[bytes]]]:
+        pipe = self._redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+        values: list[Optional[bytes]] = pipe.execute()
+        logger.info("[MGET MANY] Retrieved {} keys in a single pipeline", len(keys))
+        return values
+
+    @redis_error_handler
+    def set_if_version(
+        self, key: str, expected_version: int, value: Union[str, bytes]
+    ) -> Optional[int]:
+        if self._set_if_version_script is None:
+            # register_script caches the SHA so later calls are EVALSHA
+            self._set_if_version_script = self._redis.register_script(
+                _SET_IF_VERSION_LUA
+            )
+        return self._set_if_version_script(keys=[key], args=[expected_version, value])
+
+    def create_pipeline(self) -> Pipeline:
+        return self._redis.pipeline(transaction=False)
+
+    def enqueue_write(
+        self, operation: str, key: str, value: Optional[Union[str, bytes]] = None
+    ) -> None:
+        self._write_queue.put((operation, key, value))
+
+    def flush(self) -> None:
+        # Without a live worker nothing will ever call task_done, so join()
+        # would block forever
+        if self._flusher_thread is None or not self._flusher_thread.is_alive():
+            raise RuntimeError(
+                "[WRITE FLUSHER] Cannot flush: the write flusher thread is not running"
+            )
+        self._write_queue.join()
+
+    def _drain_write_batch(
+        self,
+        batch_size: int = 256,
+        linger_seconds: float = 0.005,
+        wait_seconds: float = 0.5,
+    ) -> list[WriteOperation]:
+        # The bounded wait on the first item keeps the worker cancellable;
+        # an indefinite get() would never observe the stop event.
+        try:
+            items: list[WriteOperation] = [self._write_queue.get(timeout=wait_seconds)]
+        except queue.Empty:
+            return []
+        while len(items) < batch_size:
+            try:
+                items.append(self._write_queue.get(timeout=linger_seconds))
+            except queue.Empty:
+                break
+        return items
 
     @redis_error_handler
-    def get_all_values_by_document_type(self, document_type: Type[T]) -> list[T]:
+    def _flush_write_batch(self, items: list[WriteOperation]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        for operation, key, value in items:
+            if operation == "set":
+                pipe.set(key, value)
+            elif operation == "delete":
+                pipe.delete(key)
+        pipe.execute()
+        logger.info("[WRITE FLUSHER] Flushed {} writes in a single pipeline", len(items))
+
+    def _flush_and_mark_done(self, items: list[WriteOperation]) -> None:
+        try:
+            self._flush_write_batch(items)
+        finally:
+            for _ in items:
+                self._write_queue.task_done()
+
+    def start_write_flusher_thread(self) -> None:
+        logger.info("[WRITE FLUSHER THREAD] Starting Redis write flusher thread...")
+
+        def wrapper():
+            while not self._stop_event.is_set():
+                items = self._drain_write_batch()
+                if len(items) > 0:
+                    self._flush_and_mark_done(items)
+            # Drain whatever was accepted before the stop was observed so
+            # shutting down does not discard queued writes
+            while True:
+                items = self._drain_write_batch(wait_seconds=0)
+                if len(items) == 0:
+                    return
+                self._flush_and_mark_done(items)
+
+        self._flusher_thread = Thread(target=wrapper, daemon=True)
+        self._flusher_thread.start()
+
+    def _load_documents_for_keys(
+        self, document_type: Type[T], keys: list[bytes], trust_stored_data: bool = False
+    ) -> list[T]:
         docs: list[T] = []
-        for key in self._redis.scan_iter(
-            f"{document_type.get_document_key_base_name()}:*"
-        ):
-            value = self._redis.get(key)
+        values = self._redis.mget(keys)
+        # Hoist the attribute lookups out of the loop; on multi-thousand-key
+        # scans the repeated method resolution is measurable.
+        _loads = orjson.loads
+        _append = docs.append
+        if trust_stored_data:
+            # Stored documents were validated on save, so model_construct can
+            # skip re-running the whole validator chain.
+            _construct = document_type.model_construct
+
+            def _build(raw_id: str, value: bytes) -> T:
+                document = _construct(**_loads(value))
+                document.id = raw_id
+                return document
+
+        else:
+            _validate = document_type.model_validate
+
+            def _build(raw_id: str, value: bytes) -> T:
+                return _validate({"id": raw_id, **_loads(value)})
+
+        for key, value in zip(keys, values):
             if value is None:
-                logger.warning(f"[SCAN ITER] Key '{key}' not found")
+                logger.warning("[MGET] Key '{}' not found", key)
                 continue
-            json_value = cast(bytes, value).decode("utf-8")
-            current_doc = document_type.model_validate(
-                {"id": key, **json.loads(json_value)}
+            # Strip the 'ClassName:' prefix so the document round-trips with
+            # the raw id it was saved under; orjson.loads accepts bytes, so
+            # no decode round trip is needed
+            raw_id = key.split(b":", 1)[1].decode("utf-8")
+            _append(_build(raw_id, value))
+        return docs
+
+    def scan_keys(
+        self, match: Union[str, bytes], scan_count: int = 1000
+    ) -> Iterator[bytes]:
+        # SCAN's COUNT is a hint for how many keys to return per round trip,
+        # not a cap; a larger hint means far fewer SCAN round trips.
+        return self._redis.scan_iter(match=match, count=scan_count)
+
+    def iter_all_values_by_document_type(
+        self,
+        document_type: Type[T],
+        scan_count: int = 1000,
+        match: Optional[Union[str, bytes]] = None,
+        trust_stored_data: bool = False,
+    ) -> Iterator[T]:
+        # Streaming variant: peak memory is one SCAN+MGET batch, not the
+        # whole collection
+        if match is None:
+            match = f"{document_type.get_document_key_base_name()}:*"
+        batch_size = 512
+        keys: list[bytes] = []
+        for key in self.scan_keys(match, scan_count):
+            keys.append(key)
+            if len(keys) >= batch_size:
+                yield from self._load_documents_for_keys(
+                    document_type, keys, trust_stored_data
+                )
+                keys.clear()
+        if len(keys) > 0:
+            yield from self._load_documents_for_keys(
+                document_type, keys, trust_stored_data
+            )
+
+    @redis_error_handler
+    def get_all_values_by_document_type(
+        self,
+        document_type: Type[T],
+        scan_count: int = 1000,
+        match: Optional[Union[str, bytes]] = None,
+        trust_stored_data: bool = False,
+    ) -> list[T]:
+        docs = list(
+            self.iter_all_values_by_document_type(
+                document_type, scan_count, match, trust_stored_data
             )
-            docs.append(current_doc)
+        )
         logger.info(
-            f"[GET ALL] Retrieved {len(docs)} documents of type '{document_type.__name__}'"
+            "[GET ALL] Retrieved {} documents of type '{}'",
+            len(docs),
+            document_type.__name__,
         )
         return docs
 
-    def is_connected(self) -> bool:
-        try:
-            self._redis.ping()
-            return True
-        except (ConnectionError, RedisError) as e:
-            logger.error(f"[IS CONNECTED ERROR] Redis connection error: {e}")
-            return False
-
-    def start_redis_heart_beat_thread(self) -> None:
-        logger.info("[REDIS HEARTBEAT THREAD] Starting Redis heartbeat thread...")
-        is_logged = False
-
-        def wrapper():
-            while True:
-                nonlocal is_logged
-                time.sleep(self.redis_properties.heartbeat_interval)
-                if not self.is_connected():
-                    logger.warning(
-                        "[REDIS HEARTBEAT THREAD] Redis connection lost, reconnecting..."
-                    )
-                    with self._lock:
-                        self._init_redis()
-                        is_logged = False
-                if not is_logged:
-                    logger.success(
-                        "[REDIS HEARTBEAT THREAD] Redis connection reestablished"
-                    )
-                    is_logged = True
-
-        Thread(target=wrapper, daemon=True).start()
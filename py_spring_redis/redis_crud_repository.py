@@ -1,5 +1,6 @@
-import json
-from typing import Generic, Optional, Type, TypeVar, get_args
+from typing import Generic, Iterator, Optional, Type, TypeVar, get_args
+
+import orjson
 from loguru import logger
 
 from py_spring import Component
@@ -10,14 +11,48 @@ from py_spring_redis.redis_client import RedisClient
 T = TypeVar("T", bound=RedisKeyDocument)
 
 
+class RepositoryPipeline(Generic[T]):
+    """Buffers save/delete calls and flushes them in one round trip on exit."""
+
+    def __init__(self, redis_client: RedisClient) -> None:
+        self._pipe = redis_client.create_pipeline()
+
+    def save(self, document: T) -> None:
+        self._pipe.set(document.get_document_id(), document.dump_json_bytes())
+
+    def delete(self, document: T) -> None:
+        self._pipe.delete(document.get_document_id())
+
+    def __enter__(self) -> "RepositoryPipeline[T]":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self._pipe.reset()
+            return
+        self._pipe.execute()
+
+
 class RedisCrudRepository(Component, Generic[T]):
     _redis_client: RedisClient
+    _model_cls: Optional[Type[T]] = None
+    # Documents are validated on save, so reads skip re-validation by default.
+    # Set to False on a subclass if stored data may predate a schema change.
+    trust_stored_data: bool = True
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        # Resolve the generic parameter once per subclass instead of walking
+        # __orig_bases__ on every instantiation.
+        cls._model_cls = cls._get_model_class()
 
     def __init__(self) -> None:
-        self._model_cls = self._get_model_class()
         if self._model_cls is None:
             return
         self._key_prefix = self._model_cls.get_document_key_base_name()
+        self._key_prefix_colon = self._key_prefix + ":"
+        # Pre-encoded once so listing calls skip the per-call str build + encode
+        self._scan_match = (self._key_prefix + ":*").encode()
 
     @classmethod
     def _get_model_class(cls) -> Optional[Type[T]]:
@@ -29,7 +64,7 @@ class RedisCrudRepository(Component, Generic[T]):
 
     def save(self, document: T) -> Optional[T]:
         value = self._redis_client.set(
-            document.get_document_id(), document.model_dump_json()
+            document.get_document_id(), document.dump_json_bytes()
         )
         if value is None:
             logger.error(f"[SAVE DOCUMENT FAIELD] Failed to save document {document}")
@@ -37,21 +72,100 @@ class RedisCrudRepository(Component, Generic[T]):
 
         return document
 
+    def save_all(self, documents: list[T]) -> list[T]:
+        pairs = [
+            (document.get_document_id(), document.dump_json_bytes())
+            for document in documents
+        ]
+        result = self._redis_client.mset_many(pairs)
+        if result is None:
+            logger.error(
+                f"[SAVE ALL DOCUMENTS FAIELD] Failed to save {len(documents)} documents"
+            )
+            return []
+
+        return documents
+
+    def _build_document(self, id: str, value: bytes) -> T:
+        if self.trust_stored_data:
+            document = self._model_cls.model_construct(**orjson.loads(value))
+            document.id = id
+            return document
+
+        return self._model_cls.model_validate({"id": id, **orjson.loads(value)})
+
     def find_by_id(self, id: str) -> Optional[T]:
-        _key = f"{self._key_prefix}:{id}"
+        _key = self._key_prefix_colon + id
         value = self._redis_client.get(_key)
         if value is None:
             return
         if self._model_cls is None:
             return
 
-        return self._model_cls.model_validate({"id": _key, **json.loads(value)})
+        return self._build_document(id, value)
 
-    def find_all(self) -> list[T]:
+    def find_by_ids(self, ids: list[str]) -> list[T]:
         if self._model_cls is None:
             return []
 
-        return self._redis_client.get_all_values_by_document_type(self._model_cls)
+        keys = [self._key_prefix_colon + id for id in ids]
+        values = self._redis_client.mget_many(keys)
+        if values is None:
+            return []
+
+        return [
+            self._build_document(id, value)
+            for id, value in zip(ids, values)
+            if value is not None
+        ]
+
+    def iter_all(self, scan_count: int = 1000) -> Iterator[T]:
+        if self._model_cls is None:
+            return iter(())
+
+        return self._redis_client.iter_all_values_by_document_type(
+            self._model_cls, scan_count, self._scan_match, self.trust_stored_data
+        )
+
+    def find_all(self, scan_count: int = 1000) -> list[T]:
+        if self._model_cls is None:
+            return []
+
+        return self._redis_client.get_all_values_by_document_type(
+            self._model_cls, scan_count, self._scan_match, self.trust_stored_data
+        )
 
     def delete(self, document: T) -> None:
         self._redis_client.delete(document.get_document_id())
+
+    def save_if_version(self, document: T, expected_version: int) -> bool:
+        result = self._redis_client.set_if_version(
+            document.get_document_id(),
+            expected_version,
+            type(document).__pydantic_serializer__.to_json(
+                document, exclude={"version"}
+            ),
+        )
+        if result != 1:
+            logger.warning(
+                "[SAVE IF VERSION] Conditional save of document {} rejected (result {})",
+                document.get_document_id(),
+                result,
+            )
+            return False
+
+        return True
+
+    def save_async(self, document: T) -> None:
+        self._redis_client.enqueue_write(
+            "set", document.get_document_id(), document.dump_json_bytes()
+        )
+
+    def delete_async(self, document: T) -> None:
+        self._redis_client.enqueue_write("delete", document.get_document_id())
+
+    def flush(self) -> None:
+        self._redis_client.flush()
+
+    def pipeline(self) -> RepositoryPipeline[T]:
+        return RepositoryPipeline(self._redis_client)
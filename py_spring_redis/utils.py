@@ -1,9 +1,14 @@
 import re
+from functools import lru_cache
 
+# Compiled once at import time; re.sub would re-look up the pattern on every call.
+_CAMEL_CASE_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
 
+
+@lru_cache(maxsize=1024)
 def convert_to_snake_case(name: str) -> str:
     """
     Convert a camelCase string to snake_case.
     """
-    # Use regex to insert underscores before capital letters
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+    # Use the precompiled regex to insert underscores before capital letters
+    return _CAMEL_CASE_PATTERN.sub("_", name).lower()
@@ -1,10 +1,9 @@
-import time
 import pytest
 from unittest.mock import MagicMock, patch
-from redis import RedisError, ConnectionError
-from threading import Lock
+from redis import RedisError
 from redis import Redis
 
+from py_spring_redis.commons import RedisKeyDocument
 from py_spring_redis.redis_client import RedisBeanCollection, RedisClient, RedisProperties
 
 
@@ -19,18 +18,27 @@ def redis_client(redis_properties: RedisProperties) -> RedisClient:
     # Create RedisClient with mock properties
     client = RedisClient()
     client.redis_properties = redis_properties
-    client._lock = Lock()
     RedisBeanCollection.redis_properties = redis_properties
     return client
 
 
+def test_redis_client_non_injectable_attributes_have_defaults() -> None:
+    # The DI container walks every class annotation before post_construct runs;
+    # annotations it cannot resolve must already be set on the instance or
+    # startup fails
+    client = RedisClient()
+    assert hasattr(client, "_write_queue")
+    assert hasattr(client, "_stop_event")
+    assert hasattr(client, "_flusher_thread")
+
+
 @patch("py_spring_redis.redis_client.RedisBeanCollection.create_redis")
 def test_redis_client_init(mock_create_redis: MagicMock, redis_client: RedisClient) -> None:
     # Mock Redis instance
     mock_redis = MagicMock(spec=Redis)
     mock_create_redis.return_value = mock_redis
 
-    # Call post_construct to initialize redis and start heartbeat thread
+    # Call post_construct to initialize redis
     redis_client.post_construct()
 
     # Check that Redis connection is established
@@ -64,7 +72,21 @@ def test_redis_get(mock_redis_class: MagicMock, redis_client: RedisClient) -> No
     # Ensure Redis 'get' was called with the correct key
     mock_redis.get.assert_called_once_with("test_key")
 
-    # Check the result is decoded correctly
+    # Check the raw bytes are returned without a decode round trip
+    assert result == b"test_value"
+
+
+@patch("py_spring_redis.redis_client.Redis")
+def test_redis_get_text(mock_redis_class: MagicMock, redis_client: RedisClient) -> None:
+    # Mock Redis instance and its 'get' method
+    mock_redis = MagicMock(spec=Redis)
+    redis_client._redis = mock_redis
+    mock_redis.get.return_value = b"test_value"
+
+    # Call the get_text method
+    result = redis_client.get_text("test_key")
+
+    # Check the result is decoded to str for text callers
     assert result == "test_value"
 
 
@@ -81,6 +103,47 @@ def test_redis_delete(mock_redis_class: MagicMock, redis_client: RedisClient) ->
     mock_redis.delete.assert_called_once_with("test_key")
 
 
+@patch("py_spring_redis.redis_client.Redis")
+def test_redis_mset_many(mock_redis_class: MagicMock, redis_client: RedisClient) -> None:
+    # Mock Redis instance and its pipeline
+    mock_redis = MagicMock(spec=Redis)
+    mock_pipe = MagicMock()
+    mock_redis.pipeline.return_value = mock_pipe
+    redis_client._redis = mock_redis
+
+    # Call mset_many with two pairs
+    pairs = [("key_1", "value_1"), ("key_2", "value_2")]
+    result = redis_client.mset_many(pairs)
+
+    # Ensure all SETs went through one non-transactional pipeline
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    mock_pipe.set.assert_any_call("key_1", "value_1")
+    mock_pipe.set.assert_any_call("key_2", "value_2")
+    mock_pipe.execute.assert_called_once()
+    assert result == pairs
+
+
+@patch("py_spring_redis.redis_client.Redis")
+def test_redis_mget_many(mock_redis_class: MagicMock, redis_client: RedisClient) -> None:
+    # Mock Redis instance and its pipeline
+    mock_redis = MagicMock(spec=Redis)
+    mock_pipe = MagicMock()
+    mock_redis.pipeline.return_value = mock_pipe
+    mock_pipe.execute.return_value = [b"value_1", None, b"value_3"]
+    redis_client._redis = mock_redis
+
+    # Call mget_many with three keys
+    result = redis_client.mget_many(["key_1", "key_2", "key_3"])
+
+    # Ensure all GETs went through one non-transactional pipeline
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    assert mock_pipe.get.call_count == 3
+    mock_pipe.execute.assert_called_once()
+
+    # Check raw bytes are returned and missing keys map to None
+    assert result == [b"value_1", None, b"value_3"]
+
+
 @patch("py_spring_redis.redis_client.Redis")
 def test_redis_get_key_not_found(mock_redis_class: MagicMock, redis_client: RedisClient) -> None:
     # Mock Redis instance and its 'get' method
@@ -98,6 +161,36 @@ def test_redis_get_key_not_found(mock_redis_class: MagicMock, redis_client: Redi
     assert result is None
 
 
+@patch("py_spring_redis.redis_client.Redis")
+def test_get_all_values_by_document_type_uses_mget(
+    mock_redis_class: MagicMock, redis_client: RedisClient
+) -> None:
+    # Mock Redis instance, its scan and batched mget
+    mock_redis = MagicMock(spec=Redis)
+    mock_redis.scan_iter.return_value = iter(
+        [b"RedisKeyDocument:1", b"RedisKeyDocument:2"]
+    )
+    mock_redis.mget.return_value = [b"{}", b"{}"]
+    redis_client._redis = mock_redis
+
+    # Call get_all_values_by_document_type
+    docs = redis_client.get_all_values_by_document_type(RedisKeyDocument)
+
+    # Ensure SCAN was asked for large pages instead of the server default of 10
+    mock_redis.scan_iter.assert_called_once_with(
+        match="RedisKeyDocument:*", count=1000
+    )
+
+    # Ensure values were fetched in one MGET batch, not per-key GETs
+    mock_redis.mget.assert_called_once_with(
+        [b"RedisKeyDocument:1", b"RedisKeyDocument:2"]
+    )
+    mock_redis.get.assert_not_called()
+
+    # Check the key prefix is stripped so ids round-trip as saved
+    assert [doc.id for doc in docs] == ["1", "2"]
+
+
 @patch("py_spring_redis.redis_client.Redis")
 def test_redis_error_handling(mock_redis_class: MagicMock, redis_client: RedisClient) -> None:
     # Mock Redis instance and its methods
@@ -115,25 +208,89 @@ def test_redis_error_handling(mock_redis_class: MagicMock, redis_client: RedisCl
 
 
 @patch("py_spring_redis.redis_client.Redis")
-def test_is_connected_success(mock_redis: MagicMock, redis_client: RedisClient) -> None:
-    # Mock Redis instance and ping method
+def test_redis_set_if_version(mock_redis_class: MagicMock, redis_client: RedisClient) -> None:
+    # Mock Redis instance and its script registration
+    mock_redis = MagicMock(spec=Redis)
+    mock_script = MagicMock(return_value=1)
+    mock_redis.register_script.return_value = mock_script
+    redis_client._redis = mock_redis
+
+    # Call set_if_version twice
+    result = redis_client.set_if_version("test_key", 3, b"{}")
+    redis_client.set_if_version("test_key", 4, b"{}")
 
+    # Ensure the Lua script is registered once and invoked with key and args
+    mock_redis.register_script.assert_called_once()
+    mock_script.assert_any_call(keys=["test_key"], args=[3, b"{}"])
+    assert result == 1
+
+
+@patch("py_spring_redis.redis_client.Redis")
+def test_async_writes_are_flushed_in_one_pipeline(
+    mock_redis_class: MagicMock, redis_client: RedisClient
+) -> None:
+    # Mock Redis instance and its pipeline
+    mock_redis = MagicMock(spec=Redis)
+    mock_pipe = MagicMock()
+    mock_redis.pipeline.return_value = mock_pipe
     redis_client._redis = mock_redis
 
-    # Simulate successful ping
-    mock_redis.ping.return_value = True
+    # Start the flusher and enqueue a set and a delete
+    redis_client.start_write_flusher_thread()
+    redis_client.enqueue_write("set", "key_1", "value_1")
+    redis_client.enqueue_write("delete", "key_2")
+
+    # flush blocks until the worker has drained the queue
+    redis_client.flush()
+
+    # Ensure both writes went through a non-transactional pipeline
+    mock_pipe.set.assert_called_once_with("key_1", "value_1")
+    mock_pipe.delete.assert_called_once_with("key_2")
+    mock_pipe.execute.assert_called()
 
-    # Call is_connected and ensure it returns True
-    assert redis_client.is_connected() is True
-    mock_redis.ping.assert_called_once()
+    # shutdown waits for the worker thread to exit
+    redis_client.shutdown()
+    assert not redis_client._flusher_thread.is_alive()
+
+    # flush fails fast once the worker is gone instead of blocking forever
+    with pytest.raises(RuntimeError):
+        redis_client.flush()
 
 
 @patch("py_spring_redis.redis_client.Redis")
-def test_is_connected_failure(mock_redis: MagicMock, redis_client: RedisClient) -> None:
+def test_shutdown_flushes_writes_accepted_before_stop(
+    mock_redis_class: MagicMock, redis_client: RedisClient
+) -> None:
+    # Mock Redis instance and its pipeline
+    mock_redis = MagicMock(spec=Redis)
+    mock_pipe = MagicMock()
+    mock_redis.pipeline.return_value = mock_pipe
     redis_client._redis = mock_redis
 
-    mock_redis.ping.side_effect = ConnectionError("Connection error")
+    # Enqueue writes and shut down immediately
+    redis_client.start_write_flusher_thread()
+    redis_client.enqueue_write("set", "key_1", "value_1")
+    redis_client.enqueue_write("set", "key_2", "value_2")
+    redis_client.shutdown()
+
+    # Everything accepted before shutdown was still written
+    mock_pipe.set.assert_any_call("key_1", "value_1")
+    mock_pipe.set.assert_any_call("key_2", "value_2")
+
+
+def test_create_redis_configures_driver_health_checks(
+    redis_properties: RedisProperties,
+) -> None:
+    RedisBeanCollection.redis_properties = redis_properties
 
-    # Call is_connected and ensure it returns False
-    assert redis_client.is_connected() is False
-    mock_redis.ping.assert_called_once()
\ No newline at end of file
+    # Create the Redis bean and inspect the pooled connection settings
+    redis = RedisBeanCollection.create_redis()
+    connection_kwargs = redis.connection_pool.connection_kwargs
+
+    # Ensure the driver handles liveness instead of a polling thread
+    assert connection_kwargs["socket_keepalive"] is True
+    assert (
+        connection_kwargs["health_check_interval"]
+        == redis_properties.heartbeat_interval
+    )
+    assert connection_kwargs["retry_on_timeout"] is True
\ No newline at end of file
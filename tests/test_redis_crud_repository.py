@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_spring_redis.redis_crud_repository import RedisCrudRepository, RedisKeyDocument
+
+
+class AccountDocument(RedisKeyDocument):
+    balance: float = 0.0
+
+
+class AccountRepository(RedisCrudRepository[AccountDocument]): ...
+
+
+@pytest.fixture
+def repository() -> AccountRepository:
+    # Create the repository with a mocked RedisClient
+    repository = AccountRepository()
+    repository._redis_client = MagicMock()
+    return repository
+
+
+def test_pipeline_batches_saves_and_deletes(repository: AccountRepository) -> None:
+    # Mock the pipeline handed out by the client
+    mock_pipe = MagicMock()
+    repository._redis_client.create_pipeline.return_value = mock_pipe
+
+    first_account = AccountDocument(id="acc_001", balance=100.0)
+    second_account = AccountDocument(id="acc_002", balance=200.0)
+
+    with repository.pipeline() as pipe:
+        pipe.save(first_account)
+        pipe.delete(second_account)
+
+        # Nothing is sent until the block exits
+        mock_pipe.execute.assert_not_called()
+
+    # Both operations were buffered and flushed in one round trip
+    mock_pipe.set.assert_called_once()
+    mock_pipe.delete.assert_called_once_with("AccountDocument:acc_002")
+    mock_pipe.execute.assert_called_once()
+
+
+def test_pipeline_is_discarded_on_error(repository: AccountRepository) -> None:
+    # Mock the pipeline handed out by the client
+    mock_pipe = MagicMock()
+    repository._redis_client.create_pipeline.return_value = mock_pipe
+
+    with pytest.raises(ValueError):
+        with repository.pipeline() as pipe:
+            pipe.save(AccountDocument(id="acc_001", balance=100.0))
+            raise ValueError("boom")
+
+    # Buffered operations are dropped, not sent
+    mock_pipe.execute.assert_not_called()
+    mock_pipe.reset.assert_called_once()